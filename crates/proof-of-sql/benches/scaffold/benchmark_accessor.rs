@@ -40,22 +40,18 @@ impl<'a, C: Commitment> BenchmarkAccessor<'a, C> {
         C::compute_commitments(&mut commitments, &committable_columns, 0, setup);
 
         let mut length = None;
-        for (column, commitment) in columns.iter().zip(commitments) {
-            self.columns.insert(
-                ColumnRef::new(table_ref, column.0, column.1.column_type()),
-                column.1.clone(),
-            );
-            self.commitments.insert(
-                ColumnRef::new(table_ref, column.0, column.1.column_type()),
-                commitment,
-            );
+        for ((column_id, column), commitment) in columns.iter().zip(commitments) {
+            let column_type = column.column_type();
+            let column_ref = ColumnRef::new(table_ref, *column_id, column_type);
+            self.columns.insert(column_ref, column.clone());
+            self.commitments.insert(column_ref, commitment);
             self.column_types
-                .insert((table_ref, column.0), column.1.column_type());
+                .insert((table_ref, *column_id), column_type);
 
             if let Some(len) = length {
-                assert!(len == column.1.len());
+                assert!(len == column.len());
             } else {
-                length = Some(column.1.len());
+                length = Some(column.len());
             }
         }
         self.lengths.insert(table_ref, length.unwrap());
@@ -5,6 +5,7 @@ use proof_of_sql::{
     base::{commitment::CommitmentEvaluationProof, database::ColumnType},
     sql::{parse::QueryExpr, proof::VerifiableQueryResult},
 };
+use proof_of_sql_parser::SelectStatement;
 use rand::prelude::Rng;
 mod benchmark_accessor;
 use benchmark_accessor::BenchmarkAccessor;
@@ -13,7 +14,7 @@ mod random_util;
 use random_util::{generate_random_columns, OptionalRandBound};
 
 fn scaffold<'a, CP: CommitmentEvaluationProof>(
-    query: &str,
+    query: &SelectStatement,
     columns: &[(&str, ColumnType, OptionalRandBound)],
     size: usize,
     prover_setup: &CP::ProverPublicSetup,
@@ -26,8 +27,7 @@ fn scaffold<'a, CP: CommitmentEvaluationProof>(
         &generate_random_columns(alloc, rng, columns, size),
         prover_setup,
     );
-    let query =
-        QueryExpr::try_new(query.parse().unwrap(), "bench".parse().unwrap(), accessor).unwrap();
+    let query = QueryExpr::try_new(query.clone(), "bench".parse().unwrap(), accessor).unwrap();
     let result = VerifiableQueryResult::new(query.proof_expr(), accessor, prover_setup);
     (query, result)
 }
@@ -48,7 +48,7 @@ pub fn jaeger_scaffold<CP: CommitmentEvaluationProof>(
     let mut rng = rand::thread_rng();
     let alloc = Bump::new();
     let (query, result) = scaffold::<CP>(
-        query,
+        &query.parse().unwrap(),
         columns,
         size,
         prover_setup,
@@ -75,13 +75,15 @@ pub fn criterion_scaffold<CP: CommitmentEvaluationProof>(
     group.sample_size(10);
     group.plot_config(PlotConfiguration::default().summary_scale(AxisScale::Logarithmic));
     init_backend();
-    let mut accessor = BenchmarkAccessor::default();
     let mut rng = rand::thread_rng();
-    let alloc = Bump::new();
+    let select_statement: SelectStatement = query.parse().unwrap();
     for &size in sizes {
+        // Use a fresh arena per size so earlier tables are freed before the next one is generated.
+        let alloc = Bump::new();
+        let mut accessor = BenchmarkAccessor::default();
         group.throughput(criterion::Throughput::Elements(size as u64));
         let (query, result) = scaffold::<CP>(
-            query,
+            &select_statement,
             columns,
             size,
             prover_setup,